@@ -1,6 +1,7 @@
 """Entry point for the Confy application."""
 
 import sys
+from collections.abc import Callable
 
 from PySide6.QtWidgets import (
     QApplication,
@@ -10,8 +11,9 @@ from PySide6.QtWidgets import (
 )
 
 from confy.labels import W_CONNECT_SERVER_TITLE
+from confy.qss import APP_STYLE
 from confy.ui import ChatWindow, ConnectToServerWindow, ConnectToUserWindow
-from confy.utils import Colors
+from confy.workers import close_http_client
 
 
 class MainWindow(QMainWindow):
@@ -22,47 +24,104 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle(W_CONNECT_SERVER_TITLE)
         self.resize(500, 300)
-        self.setStyleSheet(f'background-color: {Colors.BACKGROUND};')
+
+        # Session data filled in by the connection windows
+        self.username = None
+        self.recipient = None
+        self.server_address = None
+        self.base_url = None  # HTTP(S) URL of the server, derived from server_address
 
         # A stack of widgets where only one widget is visible at a time.
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
 
-        self.chat_window = ChatWindow()
-        self.connect_to_user_window = ConnectToUserWindow(self.change_window, self.chat_window)
+        # Only the first window is built up front; the others are created
+        # on first navigation by get_connect_to_user_window/get_chat_window.
+        self.chat_window = None
+        self.connect_to_user_window = None
         self.connect_to_server_window = ConnectToServerWindow(
-            self.change_window, self.connect_to_user_window
+            self.change_window, self.get_connect_to_user_window
         )
 
         self.stack.addWidget(self.connect_to_server_window)
-        self.stack.addWidget(self.connect_to_user_window)
-        self.stack.addWidget(self.chat_window)
 
-    def change_window(self, new_window: QWidget):
+    def get_connect_to_user_window(self) -> ConnectToUserWindow:
+        """Return the ConnectToUserWindow, building it on first use.
+
+        Returns:
+            ConnectToUserWindow: The window to connect to a recipient.
+
+        """
+        if self.connect_to_user_window is None:
+            self.connect_to_user_window = ConnectToUserWindow(
+                self.change_window, self.get_chat_window
+            )
+            self.stack.addWidget(self.connect_to_user_window)
+        return self.connect_to_user_window
+
+    def get_chat_window(self) -> ChatWindow:
+        """Return the ChatWindow, building it on first use.
+
+        Returns:
+            ChatWindow: The chat window.
+
+        """
+        if self.chat_window is None:
+            self.chat_window = ChatWindow()
+            self.stack.addWidget(self.chat_window)
+        return self.chat_window
+
+    def change_window(self, new_window: QWidget | Callable[[], QWidget]):
         """Change the current window to the specified new window.
 
         Args:
-            new_window (QWidget): The window to switch to.
+            new_window (QWidget | callable): The window to switch to, or a
+                function returning it.
 
         """
-        if isinstance(new_window, ChatWindow):
-            # Create a new ChatWindow instance with the data
-            chat_window = ChatWindow(
-                username=getattr(self, 'username', None),
-                recipient=getattr(self, 'recipient', None),
-                server_address=getattr(self, 'server_address', None),
-            )
-            self.stack.addWidget(chat_window)
-            self.stack.setCurrentWidget(chat_window)
-            self.setWindowTitle(chat_window.windowTitle())
-            self.resize(600, 500)  # Increases window size here
-        else:
+        if not isinstance(new_window, QWidget):
+            new_window = new_window()
+
+        # Suspends repaints so the page switch, title and resize are
+        # painted in a single pass
+        self.setUpdatesEnabled(False)
+        try:
+            if new_window is self.chat_window:
+                # Reuses the existing ChatWindow with the session data
+                self.chat_window.configure(
+                    username=self.username,
+                    recipient=self.recipient,
+                    server_address=self.server_address,
+                )
+                self.resize(600, 500)  # Increases window size here
+
             self.stack.setCurrentWidget(new_window)
             self.setWindowTitle(new_window.windowTitle())
+        finally:
+            self.setUpdatesEnabled(True)
 
 
-if __name__ == '__main__':
-    app = QApplication(sys.argv)
+def main(argv: list[str] | None = None) -> int:
+    """Start the Confy application and run the Qt event loop.
+
+    Args:
+        argv (list[str] | None): Arguments passed to QApplication. Defaults to sys.argv.
+
+    Returns:
+        int: Exit code returned by the Qt event loop.
+
+    """
+    app = QApplication(sys.argv if argv is None else argv)
+    app.setStyleSheet(APP_STYLE)
+
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
+    try:
+        return app.exec()
+    finally:
+        # Closes the connections kept alive for the username checks
+        close_http_client()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,4 +2,10 @@
 
 from typing import Final
 
-RAW_PAYLOAD_LENGTH: Final[int] = 2
+PAYLOAD_SEPARATOR: Final[str] = '::'
+
+# Largest incoming WebSocket frame accepted, in bytes
+WEBSOCKET_MAX_SIZE: Final[int] = 2**20
+
+# Number of messages kept in the chat area; older ones are discarded
+MESSAGES_AREA_MAX_BLOCKS: Final[int] = 2000
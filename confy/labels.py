@@ -8,6 +8,4 @@ I_PLACEHOLDER_SERVER_ADDRESS = 'Endereço do Servidor'
 I_PLACEHOLDER_USERNAME = 'Username'
 
 W_CONNECT_RECIPIENT_TITLE = 'Confy - Conectar ao destinatário'
-W_WARNING_REQUIRED_FIELDS_TEXT = 'Você precisa preencher todos os campos!'
-W_WARNING_REQUIRED_FIELDS_TITLE = 'Campos obrigatórios'
 W_CONNECT_SERVER_TITLE = 'Confy - Conectar ao servidor'
@@ -2,12 +2,30 @@
 
 from confy.utils import Colors
 
+WINDOW_STYLE = f"""
+    QWidget {{
+        background-color: {Colors.BACKGROUND};
+    }}
+"""
+
 INPUT_LABEL_STYLE = f"""
-    background-color: {Colors.INPUT_BACKGROUND};
-    border: 1.3px solid {Colors.BORDER};
-    border-radius: 10px;
-    padding: 8px;
-    color: white;
+    QLineEdit {{
+        background-color: {Colors.INPUT_BACKGROUND};
+        border: 1.3px solid {Colors.BORDER};
+        border-radius: 10px;
+        padding: 8px;
+        color: white;
+    }}
+"""
+
+MESSAGES_AREA_STYLE = f"""
+    QTextEdit {{
+        border: 1.3px solid {Colors.BORDER};
+        border-radius: 10px;
+        color: white;
+        padding: 8px;
+        background-color: #202020;
+    }}
 """
 
 BUTTON_STYLE = """
@@ -20,4 +38,48 @@ BUTTON_STYLE = """
     QPushButton:hover {
         background-color: #C0C0C0;
     }
+
+    QPushButton:disabled {
+        background-color: #666666;
+        color: #999999;
+    }
+"""
+
+SEND_BUTTON_STYLE = """
+    QPushButton#sendButton {
+        border-radius: 10px;
+    }
+
+    QPushButton#sendButton:disabled {
+        background-color: #666666;
+        color: #999999;
+    }
+"""
+
+WARNING_MESSAGE_BOX_STYLE = f"""
+    QMessageBox {{
+        background-color: {Colors.BACKGROUND};
+        color: white;
+    }}
+
+    QMessageBox QLabel {{
+        color: white;
+        font-size: 14px;
+    }}
+
+    QMessageBox QPushButton {{
+        padding: 5px 15px;
+        border-radius: 14px;
+    }}
 """
+
+# Single stylesheet applied once to the QApplication, so Qt parses the
+# rules a single time instead of once per widget.
+APP_STYLE = ''.join((
+    WINDOW_STYLE,
+    INPUT_LABEL_STYLE,
+    MESSAGES_AREA_STYLE,
+    BUTTON_STYLE,
+    SEND_BUTTON_STYLE,
+    WARNING_MESSAGE_BOX_STYLE,
+))
@@ -2,6 +2,10 @@
 
 import asyncio
 import base64
+import functools
+import html
+import sys
+from enum import IntEnum, auto
 
 import websockets
 from confy_addons import (
@@ -11,7 +15,8 @@ from confy_addons import (
     deserialize_public_key,
 )
 from confy_addons.prefixes import AES_KEY_PREFIX, AES_PREFIX, KEY_EXCHANGE_PREFIX, SYSTEM_PREFIX
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QThread, QTimer, Signal
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLineEdit,
@@ -21,8 +26,43 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from confy.core.constants import RAW_PAYLOAD_LENGTH
-from confy.utils import get_protocol, is_prefix
+from confy.core.constants import MESSAGES_AREA_MAX_BLOCKS, PAYLOAD_SEPARATOR, WEBSOCKET_MAX_SIZE
+from confy.utils import get_protocol
+
+try:
+    # Faster libuv-based event loops: winloop on Windows, uvloop elsewhere
+    if sys.platform == 'win32':
+        from winloop import new_event_loop as uv_event_loop
+    else:
+        from uvloop import new_event_loop as uv_event_loop
+except ImportError:
+    uv_event_loop = None
+
+# Prefix lengths, used to slice the payload out of every received frame
+KEY_EXCHANGE_PREFIX_LEN = len(KEY_EXCHANGE_PREFIX)
+AES_KEY_PREFIX_LEN = len(AES_KEY_PREFIX)
+AES_PREFIX_LEN = len(AES_PREFIX)
+
+# HTML templates for the chat area, formatted with already escaped values
+OWN_MESSAGE_TEMPLATE = (
+    '<div style="color: #4CAF50; font-weight: bold;">{sender}: '
+    '<span style="color: white; font-weight: normal;">{message}</span></div>'
+)
+PEER_MESSAGE_TEMPLATE = (
+    '<div style="color: #2196F3; font-weight: bold;">{sender}: '
+    '<span style="color: white; font-weight: normal;">{message}</span></div>'
+)
+SYSTEM_MESSAGE_TEMPLATE = (
+    '<div style="color: #FFC107; font-style: italic;">Sistema: {message}</div>'
+)
+
+
+class HandshakeState(IntEnum):
+    """Progress of the key exchange with the peer."""
+
+    WAITING = auto()  # Our public key hasn't been sent yet
+    PUBLIC_KEY_SENT = auto()  # Public key sent, waiting for the AES key
+    READY = auto()  # Shared AES key established, messages can flow
 
 
 class WebSocketThread(QThread):
@@ -62,29 +102,62 @@ class WebSocketThread(QThread):
         self.recipient_id = recipient_id
         self.running = True  # Flag to control thread main loop
         self.websocket = None  # Active WebSocket connection instance
+        self.loop = None  # Event loop running in this thread, set by websocket_client
+        self.send_task = None  # Task draining message_queue, cancelled by stop()
+        self.closed_by_server = False  # Set when the server closes the connection
 
         # === END-TO-END ENCRYPTION SYSTEM ===
-        # <--- MODIFIED: Instantiates RSA class that generates and stores key pair
-        self.rsa = RSAEncryption()
+        # RSAEncryption for this session, generated by websocket_client
+        self.rsa = None
 
         # Keys related to peer (other user in chat)
         self.peer_public_key = None  # RSA public key received from recipient
         self.peer_aes_key = None  # AES-256 shared key for fast encryption
 
-        # Handshake control
-        self.public_sent = False  # Flag to prevent duplicate public key sending
+        # Crypto helpers built once per session and reused for every message
+        self.peer_rsa = None  # RSAPublicEncryption for the peer's public key
+        self.aes = None  # AESEncryption for the shared AES key
+
+        # Handshake control, checked with a single comparison per frame
+        self.handshake_state = HandshakeState.WAITING
+
+        # Maps the first character of each protocol prefix, which differs
+        # between prefixes, to the prefix and the coroutine that handles it
+        self.message_handlers = {
+            prefix[0]: (prefix, handler)
+            for prefix, handler in (
+                (SYSTEM_PREFIX, self.handle_system_message),
+                (KEY_EXCHANGE_PREFIX, self.handle_public_key),
+                (AES_KEY_PREFIX, self.handle_aes_key),
+                (AES_PREFIX, self.handle_encrypted_message),
+            )
+        }
 
         # === ASYNCHRONOUS MESSAGE QUEUE ===
         # Asyncio queue to process outgoing messages in thread-safe manner
         self.message_queue = asyncio.Queue()
 
+    @functools.cached_property
+    def public_key_message(self):
+        """Key exchange frame carrying our RSA public key.
+
+        Serialized on first use and kept, since the key pair never changes.
+        Only available once websocket_client has set self.rsa.
+
+        Returns:
+            str: The KEY_EXCHANGE_PREFIX frame to be sent to the peer.
+
+        """
+        return f'{KEY_EXCHANGE_PREFIX}{self.rsa.base64_public_key}'
+
     def run(self):
         """Thread entry point - executes asyncio loop.
 
         This method is called automatically when start() is invoked.
-        Creates a new event loop for this thread.
+        Creates a new event loop for this thread, using uvloop (winloop on
+        Windows) when it is installed.
         """
-        asyncio.run(self.websocket_client())
+        asyncio.run(self.websocket_client(), loop_factory=uv_event_loop)
 
     async def websocket_client(self):
         """Main WebSocket client that manages the connection.
@@ -97,25 +170,41 @@ class WebSocketThread(QThread):
             Exception: WebSocket connection or communication errors
 
         """
+        # Keeps a reference to this thread's loop so the UI thread can
+        # hand messages over with call_soon_threadsafe
+        self.loop = asyncio.get_running_loop()
+
         # Constructs WebSocket URI based on detected protocol
         protocol, host = get_protocol(self.server_address)
         uri = f'{protocol}://{host}/ws/{self.user_id}@{self.recipient_id}'
 
         try:
-            # Establishes WebSocket connection with server
-            async with websockets.connect(uri) as websocket:
-                self.websocket = websocket
+            # Establishes WebSocket connection with server. Frames carry
+            # base64 ciphertext, which deflate cannot shrink, so
+            # permessage-deflate is not negotiated.
+            async with websockets.connect(
+                uri, compression=None, max_size=WEBSOCKET_MAX_SIZE
+            ) as self.websocket:
+                # Generates the session key pair once connected, so a server
+                # that can't be reached doesn't cost a key generation.
+                # RSA-4096 generation holds the GIL for its whole run
+                # (cryptography doesn't release it), so the UI thread also
+                # stalls meanwhile: running it on this thread only keeps it
+                # out of the window construction, it doesn't overlap with it.
+                self.rsa = RSAEncryption()
+
                 self.connection_status.emit('Conectado')
 
                 # === CONCURRENT ASYNCHRONOUS TASKS ===
                 # Task 1: Listen for server messages continuously
                 receive_task = asyncio.create_task(self.receive_messages())
                 # Task 2: Process message queue for sending
-                send_task = asyncio.create_task(self.process_send_queue())
+                self.send_task = asyncio.create_task(self.process_send_queue())
 
-                # Waits until one of the tasks completes (connection lost or error)
+                # Waits until one of the tasks completes (connection lost,
+                # error or stop() cancelling the send task)
                 done, pending = await asyncio.wait(
-                    [receive_task, send_task], return_when=asyncio.FIRST_COMPLETED
+                    [receive_task, self.send_task], return_when=asyncio.FIRST_COMPLETED
                 )
 
                 # Cancels tasks still running
@@ -126,8 +215,11 @@ class WebSocketThread(QThread):
             # Notifies UI about connection error
             self.error_occurred.emit(f'Erro de conexÃ£o: {str(e)}')
         finally:
-            # Always notifies disconnection when finishing
-            self.connection_status.emit('Desconectado')
+            # Always notifies disconnection when finishing, with a single
+            # emission that tells whether the server closed the connection
+            self.connection_status.emit(
+                'ConexÃ£o fechada' if self.closed_by_server else 'Desconectado'
+            )
 
     async def receive_messages(self):
         """Main loop to receive and process WebSocket messages.
@@ -147,7 +239,7 @@ class WebSocketThread(QThread):
                 except websockets.ConnectionClosed:
                     # Connection was closed by server or network
                     self.running = False
-                    self.connection_status.emit('ConexÃ£o fechada')
+                    self.closed_by_server = True
                     break
 
                 # Processes message based on its type/prefix
@@ -165,121 +257,159 @@ class WebSocketThread(QThread):
         - AES_KEY_PREFIX: AES key encrypted with RSA
         - AES_PREFIX: Encrypted chat messages
 
+        Each prefix is dispatched to its handler with a single lookup in
+        self.message_handlers instead of testing the prefixes one by one.
+
+        Args:
+            message (str): Raw message received from WebSocket
+
+        """
+        # Binary frames carry no prefix and go straight to the fallback
+        if isinstance(message, str):
+            # The first character selects the only candidate prefix, which
+            # is then confirmed with a single startswith
+            entry = self.message_handlers.get(message[:1])
+            if entry is not None and message.startswith(entry[0]):
+                await entry[1](message)
+                return
+
+        # === PLAIN TEXT MESSAGE (FALLBACK) ===
+        # For compatibility or debugging - not recommended in production
+        self.message_received.emit(self.recipient_id, message)
+
+    async def handle_system_message(self, message):
+        """Handle a server message (SYSTEM_PREFIX, not encrypted).
+
+        Args:
+            message (str): Raw message received from WebSocket
+
+        """
+        # Checks if recipient has connected to initiate handshake
+        if message == f'{SYSTEM_PREFIX} O usuÃ¡rio destinatÃ¡rio agora estÃ¡ conectado.':
+            # Sends public key automatically (only once)
+            if self.handshake_state is HandshakeState.WAITING:
+                await self.websocket.send(self.public_key_message)
+                self.handshake_state = HandshakeState.PUBLIC_KEY_SENT
+        # Forwards system message to UI
+        self.system_message.emit(message)
+
+    async def handle_public_key(self, message):
+        """Handle the peer's RSA public key (KEY_EXCHANGE_PREFIX).
+
         Args:
             message (str): Raw message received from WebSocket
 
         """
-        # === SERVER MESSAGES (NOT ENCRYPTED) ===
-        if is_prefix(message, SYSTEM_PREFIX):
-            # Checks if recipient has connected to initiate handshake
-            if message == f'{SYSTEM_PREFIX} O usuÃ¡rio destinatÃ¡rio agora estÃ¡ conectado.':
-                # Sends public key automatically (only once)
-                if not self.public_sent:
-                    # <--- MODIFIED: Uses instance property 'rsa'
-                    await self.websocket.send(f'{KEY_EXCHANGE_PREFIX}{self.rsa.base64_public_key}')
-                    self.public_sent = True
-            # Forwards system message to UI
-            self.system_message.emit(message)
+        # Extracts public key from message (removes prefix)
+        b64_key = message[KEY_EXCHANGE_PREFIX_LEN:]
+        try:
+            # Deserializes public key from base64
+            self.peer_public_key = deserialize_public_key(b64_key)
+            self.peer_rsa = RSAPublicEncryption(self.peer_public_key)
+        except Exception as e:
+            self.error_occurred.emit(f'Chave pÃºblica do peer invÃ¡lida: {e}')
             return
 
-        # === RECEIVES RSA PUBLIC KEY FROM PEER ===
-        elif is_prefix(message, KEY_EXCHANGE_PREFIX):
-            # Extracts public key from message (removes prefix)
-            b64_key = message[len(KEY_EXCHANGE_PREFIX) :]
+        # Responds with our public key if we haven't sent it yet
+        if self.handshake_state is HandshakeState.WAITING:
             try:
-                # Deserializes public key from base64
-                self.peer_public_key = deserialize_public_key(b64_key)
+                await self.websocket.send(self.public_key_message)
+                self.handshake_state = HandshakeState.PUBLIC_KEY_SENT
             except Exception as e:
-                self.error_occurred.emit(f'Chave pÃºblica do peer invÃ¡lida: {e}')
+                self.error_occurred.emit(f'Falha ao enviar chave pÃºblica: {e}')
                 return
 
-            # Responds with our public key if we haven't sent it yet
-            if not self.public_sent:
-                try:
-                    # <--- MODIFIED: Uses instance property 'rsa'
-                    await self.websocket.send(f'{KEY_EXCHANGE_PREFIX}{self.rsa.base64_public_key}')
-                    self.public_sent = True
-                except Exception as e:
-                    self.error_occurred.emit(f'Falha ao enviar chave pÃºblica: {e}')
-                    return
-
-            # === AES KEY GENERATION LOGIC ===
-            # Only one user should generate the AES key to avoid conflicts
-            # Criterion: user with "larger" ID lexicographically generates the key
-            if self.peer_aes_key is None and self.public_sent:
-                should_generate = str(self.user_id) > str(self.recipient_id)
-                if should_generate:
-                    # <--- MODIFIED: Instantiates AESEncryption to generate the key
-                    aes = AESEncryption()
-                    # <--- MODIFIED: Instantiates RSAPublicEncryption to encrypt
-                    encrypted_key = RSAPublicEncryption(self.peer_public_key).encrypt(aes.key)
-                    # Encodes in base64 for transmission
-                    b64_encrypted_key = base64.b64encode(encrypted_key).decode()
-                    await self.websocket.send(f'{AES_KEY_PREFIX}{b64_encrypted_key}')
-                    # Stores generated key for local use
-                    self.peer_aes_key = aes.key
-
-        # === RECEIVES ENCRYPTED AES KEY ===
-        elif is_prefix(message, AES_KEY_PREFIX):
-            # Extracts encrypted AES key from message
-            b64_enc = message[len(AES_KEY_PREFIX) :]
-            try:
-                # Decodes from base64
-                encrypted_key = base64.b64decode(b64_enc)
-                # <--- MODIFIED: Uses method from instance 'rsa'
-                # Stores AES key for message encryption
-                self.peer_aes_key = self.rsa.decrypt(encrypted_key)
-                self.system_message.emit('Chave AES estabelecida - comunicaÃ§Ã£o segura ativa')
-            except Exception as e:
-                self.error_occurred.emit(f'Falha ao descriptografar a chave AES: {e}')
+        # === AES KEY GENERATION LOGIC ===
+        # Only one user should generate the AES key to avoid conflicts
+        # Criterion: user with "larger" ID lexicographically generates the key.
+        # Both IDs are usernames (str), and the peer applies the same rule,
+        # so they are compared directly without a conversion
+        if self.handshake_state is HandshakeState.PUBLIC_KEY_SENT:
+            if self.user_id > self.recipient_id:
+                # <--- MODIFIED: Instantiates AESEncryption to generate the key
+                aes = AESEncryption()
+                encrypted_key = await asyncio.to_thread(self.peer_rsa.encrypt, aes.key)
+                # Encodes in base64 for transmission
+                b64_encrypted_key = base64.b64encode(encrypted_key).decode()
+                await self.websocket.send(f'{AES_KEY_PREFIX}{b64_encrypted_key}')
+                # Stores generated key for local use
+                self.peer_aes_key = aes.key
+                self.aes = aes
+                self.handshake_state = HandshakeState.READY
+
+    async def handle_aes_key(self, message):
+        """Handle the AES key encrypted with our RSA public key (AES_KEY_PREFIX).
+
+        Args:
+            message (str): Raw message received from WebSocket
+
+        """
+        # Extracts encrypted AES key from message
+        b64_enc = message[AES_KEY_PREFIX_LEN:]
+        try:
+            # Decodes from base64
+            encrypted_key = base64.b64decode(b64_enc)
+            # <--- MODIFIED: Uses method from instance 'rsa'
+            # Stores AES key for message encryption
+            # RSA-4096 decryption is slow, so it runs in a worker thread
+            self.peer_aes_key = await asyncio.to_thread(self.rsa.decrypt, encrypted_key)
+            self.aes = AESEncryption(self.peer_aes_key)
+            self.handshake_state = HandshakeState.READY
+            self.system_message.emit('Chave AES estabelecida - comunicaÃ§Ã£o segura ativa')
+        except Exception as e:
+            self.error_occurred.emit(f'Falha ao descriptografar a chave AES: {e}')
+
+    async def handle_encrypted_message(self, message):
+        """Handle a chat message encrypted with AES and signed (AES_PREFIX).
+
+        Args:
+            message (str): Raw message received from WebSocket
+
+        """
+        # Checks if handshake was completed
+        if self.handshake_state is not HandshakeState.READY:
+            self.system_message.emit(
+                'Mensagem criptografada recebida, mas chave AES nÃ£o definida'
+            )
             return
 
-        # === MESSAGE ENCRYPTED WITH AES ===
-        elif is_prefix(message, AES_PREFIX):
-            # Checks if handshake was completed
-            if self.peer_aes_key is None:
-                self.system_message.emit(
-                    'Mensagem criptografada recebida, mas chave AES nÃ£o definida'
-                )
+        # <--- START OF SIGNATURE VERIFICATION LOGIC --->
+        raw_payload_with_sig = message[AES_PREFIX_LEN:]
+        try:
+            # 1. Separates payload and signature. Base64 never contains
+            # ':', so the separator can only appear once
+            b64_payload, separator, b64_signature = raw_payload_with_sig.rpartition(
+                PAYLOAD_SEPARATOR
+            )
+            if not separator:
+                self.error_occurred.emit('Payload de mensagem malformado recebido.')
                 return
 
-            # <--- START OF SIGNATURE VERIFICATION LOGIC --->
-            raw_payload_with_sig = message[len(AES_PREFIX) :]
-            try:
-                # 1. Separates payload and signature
-                parts = raw_payload_with_sig.split('::')
-                if len(parts) != RAW_PAYLOAD_LENGTH:
-                    self.error_occurred.emit('Payload de mensagem malformado recebido.')
-                    return
-                b64_payload, b64_signature = parts
-
-                # 2. Decrypts the message
-                decrypted_message = AESEncryption(self.peer_aes_key).decrypt(b64_payload)
+            # 2. Decrypts the message
+            decrypted_message = self.aes.decrypt(b64_payload)
 
-                # 3. Prepares data for verification
-                decrypted_bytes = decrypted_message.encode('utf-8')
-                signature_bytes = base64.b64decode(b64_signature)
+            # 3. Prepares data for verification
+            decrypted_bytes = decrypted_message.encode('utf-8')
+            signature_bytes = base64.b64decode(b64_signature)
 
-                # 4. VERIFIES the signature
-                RSAPublicEncryption(self.peer_public_key).verify(decrypted_bytes, signature_bytes)
+            # 4. VERIFIES the signature in a worker thread, so the
+            # RSA-4096 check does not block the event loop
+            await asyncio.to_thread(self.peer_rsa.verify, decrypted_bytes, signature_bytes)
 
-                # 5. SUCCESS: Emits the decrypted and verified message
-                self.message_received.emit(self.recipient_id, decrypted_message)
+            # 5. SUCCESS: Emits the decrypted and verified message
+            self.message_received.emit(self.recipient_id, decrypted_message)
 
-            except Exception as e:
-                # 7. GENERAL FAILURE: Decryption error, base64, etc.
-                self.error_occurred.emit(f'Falha ao descriptografar/verificar mensagem: {e}')
-            # <--- END OF SIGNATURE VERIFICATION LOGIC --->
-        else:
-            # === PLAIN TEXT MESSAGE (FALLBACK) ===
-            # For compatibility or debugging - not recommended in production
-            self.message_received.emit(self.recipient_id, message)
+        except Exception as e:
+            # 7. GENERAL FAILURE: Decryption error, base64, etc.
+            self.error_occurred.emit(f'Falha ao descriptografar/verificar mensagem: {e}')
+        # <--- END OF SIGNATURE VERIFICATION LOGIC --->
 
     async def process_send_queue(self):
         """Continuously processes the message queue for sending.
 
         Infinite loop that gets messages from the queue and sends them encrypted.
-        Uses timeout to allow periodic checking of self.running flag.
+        Sleeps on the queue until a message arrives; stop() cancels the task
+        to end the loop, so there is no periodic wake-up to check self.running.
 
         Raises:
             Exception: Errors during message sending
@@ -287,34 +417,35 @@ class WebSocketThread(QThread):
         """
         while self.running:
             try:
-                # Waits for message in queue (1 second timeout)
-                message = await asyncio.wait_for(self.message_queue.get(), timeout=1.0)
+                # Waits for the next message in the queue
+                message = await self.message_queue.get()
                 # Encrypts and sends the message
                 await self.send_encrypted_and_signed_message(message)
-            except TimeoutError:
-                # Normal timeout - continues loop
-                continue
             except Exception as e:
                 self.error_occurred.emit(f'Erro ao enviar mensagem: {str(e)}')
 
     async def send_encrypted_and_signed_message(self, message):
         """Encrypts AND SIGNS a message before sending via WebSocket."""
-        if self.peer_aes_key:
+        if self.handshake_state is HandshakeState.READY:
             try:
                 # <--- START OF SIGNATURE LOGIC --->
 
                 # 1. Encrypts the message with AES
-                encrypted_payload = AESEncryption(self.peer_aes_key).encrypt(message)
+                encrypted_payload = self.aes.encrypt(message)
 
-                # 2. Signs the ORIGINAL message (in bytes) with our private key
+                # 2. Signs the ORIGINAL message (in bytes) with our private key.
+                # RSA-4096 signing is the slowest step, so it runs in a worker
+                # thread and the event loop keeps receiving meanwhile
                 message_bytes = message.encode('utf-8')
-                signature = self.rsa.sign(message_bytes)  # Uses instance 'rsa'
+                signature = await asyncio.to_thread(self.rsa.sign, message_bytes)
 
                 # 3. Encodes signature in base64
                 b64_signature = base64.b64encode(signature).decode('utf-8')
 
                 # 4. Combines and sends
-                final_payload = f'{AES_PREFIX}{encrypted_payload}::{b64_signature}'
+                final_payload = (
+                    f'{AES_PREFIX}{encrypted_payload}{PAYLOAD_SEPARATOR}{b64_signature}'
+                )
                 await self.websocket.send(final_payload)
 
                 # <--- END OF SIGNATURE LOGIC --->
@@ -333,33 +464,32 @@ class WebSocketThread(QThread):
             message (str): Message to be sent
 
         Note:
-            Uses different strategies for compatibility between asyncio versions.
+            The message is handed to the thread's own event loop with
+            call_soon_threadsafe, so no temporary loop is created per send.
 
         """
-        if self.running:
-            # === STRATEGY 1: Create new temporary loop ===
+        if self.running and self.loop is not None:
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.message_queue.put(message))
-                loop.close()
-            except Exception:
-                # === STRATEGY 2: Use existing loop (fallback) ===
-                try:
-                    asyncio.run_coroutine_threadsafe(
-                        self.message_queue.put(message), asyncio.get_event_loop()
-                    )
-                except Exception as e:
-                    # If all strategies fail, notifies error
-                    self.error_occurred.emit(f'Erro ao enfileirar mensagem: {str(e)}')
+                self.loop.call_soon_threadsafe(self.message_queue.put_nowait, message)
+            except RuntimeError as e:
+                # The loop has already been closed
+                self.error_occurred.emit(f'Erro ao enfileirar mensagem: {str(e)}')
 
     def stop(self):
         """Stops the WebSocket thread safely.
 
-        Sets stop flag and waits for thread completion.
+        Sets stop flag, wakes the send loop and waits for thread completion.
         Should be called before closing the application.
         """
         self.running = False  # Signals loops to stop
+        if self.loop is not None and self.send_task is not None:
+            try:
+                # Cancelling the send task ends websocket_client, which
+                # cancels the receive task and closes the connection
+                self.loop.call_soon_threadsafe(self.send_task.cancel)
+            except RuntimeError:
+                # The loop has already finished
+                pass
         self.quit()  # Finalizes the Qt thread
         self.wait()  # Waits for thread to complete
 
@@ -388,24 +518,45 @@ class ChatWindow(QWidget):
         super().__init__()
 
         # === CONFIGURATION PARAMETERS ===
-        self.username = username
-        self.recipient = recipient
-        self.server_address = server_address
+        self.username = None
+        self.recipient = None
+        self.server_address = None
 
         # === UI ELEMENTS ===
         self.messages_area = None  # Text area for displaying messages
+        self.messages_cursor = None  # Cursor kept at the end of messages_area
+        self.pending_html = []  # Fragments waiting for the next flush
+        self.flush_timer = None  # Coalesces appends into one insertion per tick
         self.send_button = None  # Button to send messages
         self.message_input = None  # Input field for typing messages
 
-        # Sets window title with recipient's name
-        self.setWindowTitle(f'Confy - Chat com {self.recipient}')
+        # === CONNECTION MANAGEMENT ===
+        self.websocket_thread = None  # WebSocket communication thread
+        self.connection_status = 'Desconectado'  # Current connection status
 
         # Builds the graphical interface
         self.setup_ui()
 
-        # === CONNECTION MANAGEMENT ===
-        self.websocket_thread = None  # WebSocket communication thread
-        self.connection_status = 'Desconectado'  # Current connection status
+        self.configure(username, recipient, server_address)
+
+    def configure(self, username, recipient, server_address):
+        """Set the chat session parameters on an existing window.
+
+        Lets the main window reuse a single ChatWindow instead of building
+        a new one each time the chat is opened.
+
+        Args:
+            username (str): Current user's name
+            recipient (str): Recipient's name
+            server_address (str): WebSocket server address
+
+        """
+        self.username = username
+        self.recipient = recipient
+        self.server_address = server_address
+
+        # Sets window title with recipient's name
+        self.setWindowTitle(f'Confy - Chat com {self.recipient}')
 
         # Connects automatically if all parameters were provided
         if all([username, recipient, server_address]):
@@ -419,7 +570,7 @@ class ChatWindow(QWidget):
         - Input field for new messages
         - Send button
 
-        Applies custom CSS styles for dark theme.
+        Styling comes from the application-wide stylesheet in confy.qss.
         """
         # === MAIN VERTICAL LAYOUT ===
         layout = QVBoxLayout()
@@ -429,61 +580,32 @@ class ChatWindow(QWidget):
         # === MESSAGE AREA ===
         self.messages_area = QTextEdit()
         self.messages_area.setReadOnly(True)  # View only, not editable
-        # CSS style for dark theme with rounded borders
-        self.messages_area.setStyleSheet(
-            """
-            QTextEdit {
-                border: 1.3px solid #393939;
-                border-radius: 10px;
-                color: white;
-                padding: 8px;
-                background-color: #202020;
-            }
-            """
-        )
+        # Keeps only the latest messages so layout cost stays bounded in long chats
+        self.messages_area.document().setMaximumBlockCount(MESSAGES_AREA_MAX_BLOCKS)
         layout.addWidget(self.messages_area)
 
+        # Cursor reused to append messages at the end of the document
+        self.messages_cursor = QTextCursor(self.messages_area.document())
+
+        # Messages arriving within the same 16 ms window are inserted together
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(16)
+        self.flush_timer.timeout.connect(self.flush_pending_html)
+
         # === MESSAGE SENDING AREA ===
         send_layout = QHBoxLayout()
 
         # Input field for typing
         self.message_input = QLineEdit(placeholderText='Mensagem')
         self.message_input.setFixedHeight(40)
-        self.message_input.setStyleSheet(
-            """
-            QLineEdit {
-                border: 1.3px solid #393939;
-                border-radius: 10px;
-                color: white;
-                padding: 8px;
-                background-color: #303030;
-            }
-            """
-        )
         # Connects Enter/Return to send message
         self.message_input.returnPressed.connect(self.send_message)
 
         # Send button
         self.send_button = QPushButton('Enviar')
         self.send_button.setFixedSize(60, 40)
-        self.send_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: white;
-                color: black;
-                border-radius: 10px;
-            }
-
-            QPushButton:hover {
-                background-color: #C0C0C0;
-            }
-
-            QPushButton:disabled {
-                background-color: #666666;
-                color: #999999;
-            }
-            """
-        )
+        self.send_button.setObjectName('sendButton')
         # Connects button click to send message
         self.send_button.clicked.connect(self.send_message)
 
@@ -607,26 +729,18 @@ class ChatWindow(QWidget):
             - Green (#4CAF50): Own messages
             - Blue (#2196F3): Received messages
 
+            Sender and message are escaped, so text received from the peer
+            is always shown as plain text.
+
         """
-        if is_own:
-            # Own message - name in green
-            formatted_message = (
-                f'<div style="color: #4CAF50; font-weight: bold;">'
-                f'{sender}: '
-                f'<span style="color: white; font-weight: normal;">{message}</span>'
-                f'</div>'
-            )
-        else:
-            # Received message - name in blue
-            formatted_message = (
-                f'<div style="color: #2196F3; font-weight: bold;">'
-                f'{sender}: '
-                f'<span style="color: white; font-weight: normal;">{message}</span>'
-                f'</div>'
-            )
+        # Own messages have the name in green, received ones in blue
+        template = OWN_MESSAGE_TEMPLATE if is_own else PEER_MESSAGE_TEMPLATE
+        formatted_message = template.format(
+            sender=html.escape(sender), message=html.escape(message)
+        )
 
         # Adds formatted HTML to message area
-        self.messages_area.append(formatted_message)
+        self.append_html(formatted_message)
 
     def add_system_message(self, message):
         """Add system message with special formatting.
@@ -638,10 +752,46 @@ class ChatWindow(QWidget):
             System messages appear in yellow and italic.
 
         """
-        formatted_message = (
-            f'<div style="color: #FFC107; font-style: italic;">Sistema: {message}</div>'
-        )
-        self.messages_area.append(formatted_message)
+        formatted_message = SYSTEM_MESSAGE_TEMPLATE.format(message=html.escape(message))
+        self.append_html(formatted_message)
+
+    def append_html(self, fragment):
+        """Queue an HTML fragment to be appended as a new paragraph in the chat area.
+
+        Fragments are buffered and inserted by flush_pending_html on the next
+        timer tick, so a burst of messages costs a single relayout.
+
+        Args:
+            fragment (str): HTML fragment to be appended
+
+        """
+        self.pending_html.append(fragment)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush_pending_html(self):
+        """Insert all queued HTML fragments at the end of the chat area at once.
+
+        Inserts through a cursor kept at the end of the document instead of
+        QTextEdit.append, and adjusts the scroll position once per batch.
+        """
+        if not self.pending_html:
+            return
+
+        scroll_bar = self.messages_area.verticalScrollBar()
+        # Only follows new messages if the user hasn't scrolled up
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+
+        cursor = self.messages_cursor
+        cursor.movePosition(QTextCursor.End)
+        for fragment in self.pending_html:
+            if not self.messages_area.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(fragment)
+        self.pending_html.clear()
+
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
 
     def update_connection_status(self, status):
         """Update connection status and controls enabling.
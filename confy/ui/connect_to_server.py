@@ -1,17 +1,16 @@
-"""Module for the ConnectToUserWindow class."""
+"""Module for the ConnectToServerWindow class."""
 
-import importlib.resources
+from collections.abc import Callable
+from functools import partial
 from http import HTTPStatus
 from urllib.parse import urljoin
 
-import httpx
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPixmap
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import Qt, QThreadPool
 from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QPushButton,
+    QSizePolicy,
     QVBoxLayout,
     QWidget,
 )
@@ -20,11 +19,9 @@ from confy.labels import (
     B_CONNECT,
     I_PLACEHOLDER_SERVER_ADDRESS,
     I_PLACEHOLDER_USERNAME,
-    W_WARNING_REQUIRED_FIELDS_TEXT,
-    W_WARNING_REQUIRED_FIELDS_TITLE,
 )
-from confy.qss import BUTTON_STYLE, INPUT_LABEL_STYLE
-from confy.utils import get_protocol, warning_message_box
+from confy.utils import get_protocol, shield_pixmap, warning_message_box
+from confy.workers import RequestWorker
 
 
 class ConnectToServerWindow(QWidget):
@@ -32,128 +29,173 @@ class ConnectToServerWindow(QWidget):
 
     Args:
         change_window_callback (callable): Function to change the current window.
-        new_window_callback (QWidget, optional): Window to be displayed after connection.
+        new_window_callback (QWidget | callable, optional): Window to be displayed
+            after connection, or a function returning it.
 
     """
 
-    def __init__(self, change_window_callback, new_window_callback: QWidget = None):
+    def __init__(
+        self,
+        change_window_callback,
+        new_window_callback: QWidget | Callable[[], QWidget] | None = None,
+    ):
         """Initialize the ConnectToServerWindow.
 
         Args:
             change_window_callback (callable): Function to change the current window.
-            new_window_callback (QWidget, optional): Window to be displayed after connection.
+            new_window_callback (QWidget | callable, optional): Window to be displayed
+                after connection, or a function returning it.
 
         """
         super().__init__()
 
         self.change_window_callback = change_window_callback
         self.new_window_callback = new_window_callback
+        self.request_worker = None  # Username verification in progress, if any
 
-        layout = QVBoxLayout()
-        layout.setAlignment(Qt.AlignCenter)
-        layout.setSpacing(15)
+        # Lets the application stylesheet paint this widget's background
+        # directly instead of going through the palette
+        self.setAttribute(Qt.WA_StyledBackground, True)
 
         # Logo
         self.logo = QLabel()
         self.logo.setFixedSize(60, 65)
         self.logo.setAlignment(Qt.AlignCenter)
-
-        # Renders SVG into a QPixmap
-        with importlib.resources.path('confy.assets', 'shield.svg') as img_path:
-            svg_renderer = QSvgRenderer(str(img_path))
-        pixmap = QPixmap(60, 65)
-        pixmap.fill(Qt.transparent)
-
-        painter = QPainter(pixmap)
-        svg_renderer.render(painter)
-        painter.end()
-
-        self.logo.setPixmap(pixmap)
-
-        layout.addWidget(self.logo, alignment=Qt.AlignCenter)
+        self.logo.setPixmap(shield_pixmap(self.devicePixelRatioF()))
 
         # Username field
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText(I_PLACEHOLDER_USERNAME)
         self.username_input.setFixedSize(250, 40)
-        self.username_input.setStyleSheet(INPUT_LABEL_STYLE)
-        layout.addWidget(self.username_input)
 
         # Server address field
         self.server_address_input = QLineEdit()
         self.server_address_input.setPlaceholderText(I_PLACEHOLDER_SERVER_ADDRESS)
         self.server_address_input.setFixedSize(250, 40)
-        self.server_address_input.setStyleSheet(INPUT_LABEL_STYLE)
-        layout.addWidget(self.server_address_input)
 
         # Connect button
         self.connect_button = QPushButton(B_CONNECT)
         self.connect_button.clicked.connect(self.handle_login)
         self.connect_button.setFixedSize(100, 40)
-        self.connect_button.setStyleSheet(BUTTON_STYLE)
-        layout.addWidget(self.connect_button, alignment=Qt.AlignCenter)
 
         # Connect by pressing Enter in server address field
         self.server_address_input.returnPressed.connect(self.handle_login)
 
+        # The button is only enabled while both fields are filled
+        self.username_input.textChanged.connect(self.update_connect_button)
+        self.server_address_input.textChanged.connect(self.update_connect_button)
+        self.update_connect_button()
+
+        # Assembles the layout in a single pass once every widget exists.
+        # All children have fixed sizes, so the layout never has to
+        # negotiate stretch for them.
+        layout = QVBoxLayout()
+        layout.setAlignment(Qt.AlignCenter)
+        layout.setSpacing(15)
+        for widget in (
+            self.logo,
+            self.username_input,
+            self.server_address_input,
+            self.connect_button,
+        ):
+            widget.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+            layout.addWidget(widget, alignment=Qt.AlignCenter)
+
         self.setLayout(layout)
 
+    def fields_filled(self):
+        """Return whether both the username and server address fields are filled.
+
+        Returns:
+            bool: True if neither field is empty or blank.
+
+        """
+        return bool(self.username_input.text().strip()) and bool(
+            self.server_address_input.text().strip()
+        )
+
+    def update_connect_button(self):
+        """Enable the connect button only when a verification can be started."""
+        self.connect_button.setEnabled(self.request_worker is None and self.fields_filled())
+
     def handle_login(self):
         """Handle the login process by verifying the username with the server."""
-        username = self.username_input.text()
-        server_address = self.server_address_input.text()
+        # Ignores clicks already queued while a verification is running
+        if self.request_worker is not None:
+            return
+
+        # Read and stripped once; the checks, the request URL and the
+        # session data below all use these values
+        username = self.username_input.text().strip()
+        server_address = self.server_address_input.text().strip()
 
-        # Checks if name and server fields are filled
-        # If not, displays a warning message
+        # The connect button stays disabled until both fields are filled,
+        # so only Return pressed in an empty field gets here
         if not username or not server_address:
+            return
+
+        # === INITIALIZATION OF USERNAME VERIFICATION ===
+        # Disables button to prevent multiple simultaneous requests
+        self.connect_button.setEnabled(False)
+        self.connect_button.setText('Verificando...')
+
+        # === CONSTRUCTION OF ENDPOINT URL ===
+        # Ensures server has HTTP(S) protocol
+        protocol, host = get_protocol(server_address, check_username=True)
+        base_url = f'{protocol}://{host}'
+
+        # Constructs full URL for username verification
+        endpoint = f'/online-users/{username}'
+        url = urljoin(base_url, endpoint)
+
+        # === HTTP REQUEST IN BACKGROUND ===
+        # Runs in a thread pool with a 10 second timeout, so the window
+        # keeps painting and responding while waiting for the server
+        self.request_worker = RequestWorker(url, timeout=10)
+        signals = self.request_worker.signals
+        signals.response_received.connect(
+            partial(self.on_login_response, username, server_address, base_url)
+        )
+        signals.request_failed.connect(partial(warning_message_box, self))
+        signals.finished.connect(self.on_login_finished)
+        QThreadPool.globalInstance().start(self.request_worker)
+
+    def on_login_response(self, username, server_address, base_url, status_code):
+        """Handle the server's answer to the username verification.
+
+        Args:
+            username (str): Username that was verified.
+            server_address (str): Server address used for the verification.
+            base_url (str): HTTP(S) base URL built from the server address.
+            status_code (int): HTTP status code of the response.
+
+        """
+        if status_code == HTTPStatus.OK:
+            # Status 200: Username is available
+            main_window = self.parentWidget().parentWidget()
+            main_window.username = username
+            main_window.server_address = server_address
+            # Kept so later requests to the server skip parsing the address again
+            main_window.base_url = base_url
+            if self.new_window_callback:
+                self.change_window_callback(self.new_window_callback)
+        elif status_code == HTTPStatus.CONFLICT:
+            # Status 409 (Conflict): Username is already in use
             warning_message_box(
-                self, W_WARNING_REQUIRED_FIELDS_TITLE, W_WARNING_REQUIRED_FIELDS_TEXT
+                self,
+                'Username Indisponível',
+                'Este nome de usuário já está em uso. Tente outro nome.',
             )
         else:
-            # === INITIALIZATION OF USERNAME VERIFICATION ===
-            # Disables button to prevent multiple simultaneous requests
-            self.connect_button.setEnabled(False)
-            self.connect_button.setText('Verificando...')
-
-            # === CONSTRUCTION OF ENDPOINT URL ===
-            # Ensures server has HTTP(S) protocol
-            protocol, host = get_protocol(server_address, check_username=True)
-            base_url = f'{protocol}://{host}'
-
-            # Constructs full URL for username verification
-            endpoint = f'/online-users/{username}'
-            url = urljoin(base_url, endpoint)
-
-            # === HTTP REQUEST WITH TIMEOUT ===
-            # 10 second timeout to prevent indefinite hanging
-            try:
-                response = httpx.get(url, timeout=10)
-                if response.status_code == HTTPStatus.OK:
-                    # Status 200: Username is available
-                    main_window = self.parentWidget().parentWidget()
-                    main_window.username = username
-                    main_window.server_address = server_address
-                    if self.new_window_callback:
-                        self.change_window_callback(self.new_window_callback)
-                elif response.status_code == HTTPStatus.CONFLICT:
-                    # Status 409 (Conflict): Username is already in use
-                    warning_message_box(
-                        self,
-                        'Username Indisponível',
-                        'Este nome de usuário já está em uso. Tente outro nome.',
-                    )
-                else:
-                    # Other status codes: unexpected error
-                    warning_message_box(
-                        self,
-                        'Erro de Conexão',
-                        'Não foi possível verificar a disponibilidade do username.',
-                    )
-            except (httpx.RequestError, httpx.ConnectError) as e:
-                warning_message_box(
-                    self, title='Erro de Rede', text=f'Falha ao conectar ao servidor: {str(e)}'
-                )
-            except Exception as e:
-                warning_message_box(self, 'Erro', f'Ocorreu um erro inesperado: {str(e)}')
-            self.connect_button.setEnabled(True)
-            self.connect_button.setText(B_CONNECT)
+            # Other status codes: unexpected error
+            warning_message_box(
+                self,
+                'Erro de Conexão',
+                'Não foi possível verificar a disponibilidade do username.',
+            )
+
+    def on_login_finished(self):
+        """Restore the connect button once the verification is over."""
+        self.request_worker = None
+        self.connect_button.setText(B_CONNECT)
+        self.update_connect_button()
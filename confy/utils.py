@@ -1,24 +1,25 @@
 """Utility functions and classes for the Confy application."""
 
+import functools
+import importlib.resources
 import os
 import sys
-from enum import Enum
+from enum import StrEnum
 
 from PySide6.QtCore import QByteArray, Qt
-from PySide6.QtGui import QIcon, QPainter, QPixmap
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtGui import QIcon, QImage, QPainter, QPixmap, QPixmapCache
 from PySide6.QtWidgets import QMessageBox
 
+WARNING_MESSAGE_BOX_NAME = 'warningMessageBox'
 
-class Colors(Enum):
+
+class Colors(StrEnum):
     BACKGROUND = '#212121'
     INPUT_BACKGROUND = '#303030'
     BORDER = '#393939'
 
-    def __str__(self):
-        return self.value
-
 
+@functools.cache
 def resource_path(relative_path: str) -> str:
     """Return the absolute path to a resource, even if packaged with PyInstaller."""
     if hasattr(sys, '_MEIPASS'):
@@ -27,6 +28,20 @@ def resource_path(relative_path: str) -> str:
     return os.path.join(os.path.abspath('.'), relative_path)
 
 
+@functools.cache
+def asset_bytes(name: str) -> bytes:
+    """Return the contents of a file in confy.assets, read only once per process.
+
+    Args:
+        name (str): File name inside the confy.assets package.
+
+    Returns:
+        bytes: The file contents.
+
+    """
+    return importlib.resources.files('confy.assets').joinpath(name).read_bytes()
+
+
 def is_prefix(message, prefix: str) -> bool:
     """Check if a message is a string that starts with the provided prefix.
 
@@ -39,14 +54,16 @@ def is_prefix(message, prefix: str) -> bool:
               False otherwise.
 
     """
-    if isinstance(message, str) and message.startswith(prefix):
-        return True
-    return False
+    return isinstance(message, str) and message.startswith(prefix)
 
 
+@functools.lru_cache(maxsize=32)
 def get_protocol(url: str, check_username: bool | None = None) -> tuple[str, str]:
     """Determine the appropriate WebSocket protocol (ws or wss) based on the URL scheme.
 
+    Results are cached, since the same server address is resolved on every
+    connection attempt.
+
     Args:
         url (str): Full URL, including the protocol (http:// or https://).
         check_username (bool | None): If True, returns 'http' or 'https' instead of 'ws' or 'wss'.
@@ -57,21 +74,75 @@ def get_protocol(url: str, check_username: bool | None = None) -> tuple[str, str
             - The hostname extracted from the URL.
 
     """
-    hostname = url.split('://')
-    protocol = 'ws'
-
-    if hostname[0] == 'https':
-        protocol = 'wss'
+    # Splits once at the first separator, without building a list
+    scheme, _, hostname = url.partition('://')
+    secure = scheme == 'https'
 
     if check_username:
-        protocol = 'https' if hostname[0] == 'https' else 'http'
+        return ('https' if secure else 'http'), hostname
 
-    return protocol, hostname[1]
+    return ('wss' if secure else 'ws'), hostname
 
 
+@functools.lru_cache(maxsize=32)
+def svg_renderer(svg_data: bytes):
+    """Return a QSvgRenderer for an SVG document, parsing each document only once.
+
+    Args:
+        svg_data (bytes): The SVG content.
+
+    Returns:
+        QSvgRenderer: Renderer holding the parsed document.
+
+    """
+    # QtSvg is only needed to rasterize icons, so it is imported on demand
+    # to keep it out of the application's start-up import chain.
+    from PySide6.QtSvg import QSvgRenderer  # noqa: PLC0415
+
+    return QSvgRenderer(QByteArray(svg_data))
+
+
+def render_svg(renderer, width: int, height: int, device_pixel_ratio: float = 1.0) -> QPixmap:
+    """Rasterize an SVG renderer into a QPixmap.
+
+    Widgets receive an already rasterized pixmap, which keeps SVG parsing
+    and painting out of stylesheets and paint events.
+
+    Args:
+        renderer (QSvgRenderer): Renderer holding the loaded SVG document.
+        width (int): Width of the pixmap in device-independent pixels.
+        height (int): Height of the pixmap in device-independent pixels.
+        device_pixel_ratio (float): Scale of the screen the pixmap is shown on.
+
+    Returns:
+        QPixmap: The rendered SVG.
+
+    """
+    # Renders into a premultiplied ARGB image, Qt's native blending format,
+    # so painting the resulting pixmap needs no per-pixel conversion
+    image = QImage(
+        round(width * device_pixel_ratio),
+        round(height * device_pixel_ratio),
+        QImage.Format_ARGB32_Premultiplied,
+    )
+    image.fill(Qt.transparent)
+
+    painter = QPainter(image)
+    renderer.render(painter)
+    painter.end()
+
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    return pixmap
+
+
+@functools.lru_cache(maxsize=256)
 def icon(svg_string, size=24, color: str | None = None):
     """Create a QIcon from an SVG string.
 
+    Icons are memoized by their arguments, so asking again for the same
+    icon returns the already rendered, implicitly shared QIcon.
+
     Args:
         svg_string (str): The SVG content as a string.
         size (int): The desired size of the icon (width and height).
@@ -85,46 +156,53 @@ def icon(svg_string, size=24, color: str | None = None):
         svg_string = svg_string.replace('stroke="currentColor"', f'stroke="{color}"')
         svg_string = svg_string.replace('fill="currentColor"', f'fill="{color}"')
 
-    renderer = QSvgRenderer(QByteArray(svg_string.encode()))
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-    painter = QPainter(pixmap)
-    renderer.render(painter)
-    painter.end()
-    return QIcon(pixmap)
+    return QIcon(render_svg(svg_renderer(svg_string.encode()), size, size))
+
+
+def shield_pixmap(device_pixel_ratio: float = 1.0) -> QPixmap:
+    """Return the shield logo rendered into a QPixmap.
+
+    The rendered logo is stored in QPixmapCache, keyed by device pixel
+    ratio, so the SVG is only rasterized again if Qt evicts it or the
+    logo is needed for a screen with a different scale.
+
+    Args:
+        device_pixel_ratio (float): Scale of the screen the logo is shown on.
+
+    Returns:
+        QPixmap: The 60x65 shield logo.
+
+    """
+    key = f'confy:shield:{device_pixel_ratio}'
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+
+    # The parsed document is shared by the renderings for every scale
+    renderer = svg_renderer(asset_bytes('shield.svg'))
+    pixmap = render_svg(renderer, 60, 65, device_pixel_ratio)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 
 def warning_message_box(object, title: str, text: str):
     """Display a warning message box with the given title and text.
 
+    The message box is built once per parent widget and reused by later
+    calls, which only update its title and text.
+
     Args:
         object (QWidget): Parent widget for the message box.
         title (str): Title of the message box.
         text (str): Text content of the message box.
 
     """
-    msg = QMessageBox(object)
-    msg.setIcon(QMessageBox.Warning)
+    msg = object.findChild(QMessageBox, WARNING_MESSAGE_BOX_NAME)
+    if msg is None:
+        msg = QMessageBox(object)
+        msg.setObjectName(WARNING_MESSAGE_BOX_NAME)
+        msg.setIcon(QMessageBox.Warning)
+        msg.setStandardButtons(QMessageBox.Ok)
     msg.setWindowTitle(title)
     msg.setText(text)
-    msg.setStandardButtons(QMessageBox.Ok)
-    msg.setStyleSheet("""
-    QMessageBox {
-        background-color: #212121;
-        color: white;
-    }
-    QLabel {
-        color: white;
-        font-size: 14px;
-    }
-    QPushButton {
-        background-color: white;
-        color: black;
-        padding: 5px 15px;
-        border-radius: 14px;
-    }
-    QPushButton:hover {
-        background-color: #C0C0C0;
-    }
-""")
     msg.exec()
@@ -0,0 +1,86 @@
+"""Background workers that keep blocking calls off the Qt main thread."""
+
+import functools
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+@functools.cache
+def http_client():
+    """Return the httpx.Client shared by every request.
+
+    Reusing one client keeps connections to the server alive instead of
+    reconnecting (and redoing TLS) on each verification. httpx.Client is
+    safe to use from several QThreadPool threads.
+
+    httpx is imported here, on the first request, since it is not needed
+    to show the first window.
+
+    Returns:
+        httpx.Client: The shared client.
+
+    """
+    import httpx  # noqa: PLC0415
+
+    return httpx.Client()
+
+
+def close_http_client():
+    """Close the shared httpx.Client, if a request ever created it."""
+    if http_client.cache_info().currsize:
+        http_client().close()
+        http_client.cache_clear()
+
+
+class RequestSignals(QObject):
+    """Signals emitted by a RequestWorker.
+
+    QRunnable is not a QObject, so the signals live in this companion object.
+    """
+
+    response_received = Signal(int)  # HTTP status code of the response
+    request_failed = Signal(str, str)  # (title, text) of the warning to be shown
+    finished = Signal()  # Emitted last, whatever the outcome
+
+
+class RequestWorker(QRunnable):
+    """Perform an HTTP GET request in a QThreadPool thread.
+
+    Args:
+        url (str): URL to be requested.
+        timeout (float): Request timeout in seconds.
+
+    """
+
+    def __init__(self, url, timeout=10):
+        """Initialize the RequestWorker.
+
+        Args:
+            url (str): URL to be requested.
+            timeout (float): Request timeout in seconds.
+
+        """
+        super().__init__()
+        self.url = url
+        self.timeout = timeout
+        self.signals = RequestSignals()
+
+    def run(self):
+        """Send the request and report the result through the signals."""
+        # Imported here, on this worker thread; http_client has already
+        # loaded it by the time the request can fail
+        import httpx  # noqa: PLC0415
+
+        try:
+            response = http_client().get(self.url, timeout=self.timeout)
+        except httpx.RequestError as e:
+            # Network failures: server unreachable, timeout, etc.
+            self.signals.request_failed.emit(
+                'Erro de Rede', f'Falha ao conectar ao servidor: {str(e)}'
+            )
+        except Exception as e:
+            self.signals.request_failed.emit('Erro', f'Ocorreu um erro inesperado: {str(e)}')
+        else:
+            self.signals.response_received.emit(response.status_code)
+        finally:
+            self.signals.finished.emit()